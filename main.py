@@ -1,45 +1,171 @@
 
 
 # Import modules
+import csv
+import hashlib
+import os
+import numpy as np
 import pandas as pd
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
 from datetime import datetime
+from functools import lru_cache
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+try:
+    import numba
+except ImportError:  # optional, the TOU aggregation falls back to np.bincount
+    numba = None
+
 
 # Functions to handle data and calculations
 
+def find_timestamp_column(file_path):
+    """Return the CSV header name of the timestamp column (case-insensitive)."""
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader([f.readline()]), [])
+
+    for col in header:
+        if col.strip().lower() == "timestamp":
+            return col
+    return "timestamp"
+
+
+# Parsed CSVs are cached here as feather files (needs pyarrow)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "xpower")
+CACHE_VERSION = 2  # bump whenever load_consumption_data's output changes
+
+
+def cache_path_for(file_path):
+    """Feather cache file for a CSV: <path hash>-<hash of mtime and CACHE_VERSION>.feather"""
+    path_hash = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+    state_hash = hashlib.sha1(f"{os.path.getmtime(file_path)}:{CACHE_VERSION}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{path_hash}-{state_hash}.feather")
+
+
+def prune_cache(cache_path):
+    """Remove cache entries for the same CSV other than cache_path, plus old unversioned entries"""
+    keep = os.path.basename(cache_path)
+    prefix = keep.split("-")[0] + "-"
+    for name in os.listdir(CACHE_DIR):
+        if name != keep and name.endswith(".feather") and (name.startswith(prefix) or "-" not in name):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+
+def read_consumption_csv(file_path, ts_col, **kwargs):
+    """Read only the timestamp and kWh columns, with kWh as float32 and dates parsed while reading"""
+    return pd.read_csv(file_path, usecols=[ts_col, "kWh"], dtype={"kWh": np.float32},
+                       parse_dates=[ts_col], cache_dates=True, engine="c", **kwargs)
+
+
+def coerce_timestamps(timestamps):
+    """Unparseable timestamps leave the column as text, so coerce those to NaT"""
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        return pd.to_datetime(timestamps, errors="coerce")
+    return timestamps
+
+
 def load_consumption_data(file_path):
     """Load CSV file with timestamp and kWh columns."""
-    df = pd.read_csv(file_path)
+    cache_path = cache_path_for(file_path)
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_feather(cache_path)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable cache {cache_path}: {e}")
 
-    # Looping over columns
-    for col in df.columns:
-        if col.strip().lower() == "timestamp":
-            df.rename(columns={col: "timestamp"}, inplace=True)
-            break
+    ts_col = find_timestamp_column(file_path)
 
-    # Convert to datetime
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    df = read_consumption_csv(file_path, ts_col)
+    df.rename(columns={ts_col: "timestamp"}, inplace=True)
+    df["timestamp"] = coerce_timestamps(df["timestamp"])
 
     # Handling error where timestamp couldn’t be parsed
-    if df["timestamp"].isna().any():
+    has_time = df["timestamp"].notna()
+    if not has_time.all():
         print("Warning: Some rows had invalid timestamps and were dropped.")
-        df = df.dropna(subset=["timestamp"])
+
+    # Missing kWh readings are skipped, as summing the column always did
+    # Only copy when there is something to drop
+    valid = has_time & df["kWh"].notna()
+    if not valid.all():
+        df = df.loc[valid].reset_index(drop=True)
+
+    # Sort once here so plotting doesn't have to on every calculation;
+    # meter exports are usually in order already, so skip the copy then
+    if not df["timestamp"].is_monotonic_increasing:
+        df = df.sort_values("timestamp", kind="mergesort", ignore_index=True)
+
+    # Hour of day never changes after load, so decode it once
+    df["hour"] = df["timestamp"].dt.hour.astype(np.int8)
+
+    # Skip parsing next time this exact file is loaded
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_feather(cache_path)
+        prune_cache(cache_path)
+    except ImportError:
+        pass  # pyarrow not installed, caching is optional
+    except OSError as e:
+        print(f"Warning: Could not cache parsed data: {e}")
 
     return df
 
 
+def hours_of(df):
+    """Hour of day per row, using the column precomputed at load time when present"""
+    if 'hour' in df:
+        return df['hour'].to_numpy()
+    return df['timestamp'].dt.hour.to_numpy(np.int8)
+
+
+def usage_arrays(df):
+    """Hour and kWh arrays for the TOU aggregation, skipping rows with missing kWh"""
+    hours = hours_of(df)
+    kwh = df['kWh'].to_numpy(copy=False)
+    missing = np.isnan(kwh)
+    if missing.any():
+        hours, kwh = hours[~missing], kwh[~missing]
+    return hours, kwh
+
+
+def total_kwh_of(df):
+    """Total kWh, summed with a float64 accumulator over the float32 column, skipping missing readings"""
+    kwh = df['kWh'].to_numpy(copy=False)
+    return kwh.sum(dtype=np.float64, where=~np.isnan(kwh))
+
+
 def calculate_flat_rate_from_data(df, rate_per_kwh, fixed_fee=0):
     """Flat rate = total kWh × rate + fixed fee"""
-    total_kwh = df['kWh'].sum()
+    return calculate_flat_rate_from_total(total_kwh_of(df), rate_per_kwh, fixed_fee)
+
+
+def calculate_flat_rate_from_total(total_kwh, rate_per_kwh, fixed_fee=0):
+    """Flat rate from an already summed kWh total"""
     return (total_kwh * rate_per_kwh) + fixed_fee
 
 
+# TOU periods and the code each hour of the day maps to
+_PERIODS = ("Peak", "Off-Peak", "Shoulder")
+_HOUR_TO_CODE = np.empty(24, np.int8)
+_HOUR_TO_CODE[18:22] = 0  # Peak: 6pm–10pm
+_HOUR_TO_CODE[22:] = 1    # Off-Peak: 10pm–7am
+_HOUR_TO_CODE[:7] = 1
+_HOUR_TO_CODE[7:18] = 2   # Shoulder
+
+
+_PERIOD_BY_HOUR = tuple(_PERIODS[code] for code in _HOUR_TO_CODE)
+
+
 def classify_period(hour):
     """Classify hour into TOU period"""
+    if type(hour) is int and 0 <= hour < 24:
+        return _PERIOD_BY_HOUR[hour]
+
+    # Anything else (floats, NumPy scalars, out-of-range hours) keeps the original comparisons
     if 18 <= hour < 22:  # Peak: 6pm–10pm
         return "Peak"
     elif 22 <= hour or hour < 7:  # Off-Peak: 10pm–7am
@@ -48,16 +174,42 @@ def classify_period(hour):
         return "Shoulder"
 
 
+if numba is not None:
+    @numba.njit(cache=True)
+    def _period_kwh_sums_jit(hours, kwh):
+        """Single pass over hours and kWh, accumulating each period's sum"""
+        sums = np.zeros(len(_PERIODS))
+        for i in range(hours.shape[0]):
+            sums[_HOUR_TO_CODE[hours[i]]] += kwh[i]
+        return sums
+
+
+def period_kwh_sums(hours, kwh):
+    """Sum kWh per TOU period code (ordered as _PERIODS); kwh must not contain NaN"""
+    if numba is not None:
+        return _period_kwh_sums_jit(hours, kwh)
+
+    codes = _HOUR_TO_CODE[hours]
+    return np.bincount(codes, weights=kwh, minlength=len(_PERIODS))
+
+
 def calculate_tou_from_data(df, rates, fixed_fee=0):
     """TOU tariff calculation with breakdown"""
-    df['period'] = df['timestamp'].dt.hour.apply(classify_period)
-    tou_breakdown = {p: {"kWh": 0, "rate": r, "cost": 0} for p, r in rates.items()}
+    period_sums = period_kwh_sums(*usage_arrays(df))
+    return calculate_tou_from_sums(period_sums, rates, fixed_fee)
 
-    for period, group in df.groupby('period'):
-        kwh_sum = group['kWh'].sum()
-        rate = rates.get(period, 0)
-        tou_breakdown[period]["kWh"] = kwh_sum
-        tou_breakdown[period]["cost"] = kwh_sum * rate
+
+def calculate_tou_from_sums(period_sums, rates, fixed_fee=0):
+    """TOU tariff calculation from per-period kWh sums"""
+    for period in _PERIODS:
+        if period not in rates:
+            raise KeyError(f"No TOU rate given for the {period} period")
+
+    # Periods outside the TOU schedule get no consumption
+    tou_breakdown = {}
+    for period, rate in rates.items():
+        kwh_sum = period_sums[_PERIODS.index(period)] if period in _PERIODS else 0
+        tou_breakdown[period] = {"kWh": kwh_sum, "rate": rate, "cost": kwh_sum * rate}
 
     total_cost = sum(item["cost"] for item in tou_breakdown.values()) + fixed_fee
     return total_cost, tou_breakdown
@@ -65,29 +217,36 @@ def calculate_tou_from_data(df, rates, fixed_fee=0):
 
 def calculate_tiered_from_data(df, tiers, fixed_fee=0):
     """Tiered tariff calculation with breakdown"""
-    total_kwh = df['kWh'].sum()
-    total_cost = 0
-    remaining = total_kwh
-    last_threshold = 0
-    tier_breakdown = []
-
-    for threshold, rate in tiers:
-        if remaining <= 0:
-            break
-        block = min(remaining, threshold - last_threshold)
-        total_cost += block * rate
-        tier_breakdown.append((block, rate))
-        remaining -= block
-        last_threshold = threshold
+    return calculate_tiered_from_total(total_kwh_of(df), tiers, fixed_fee)
+
+
+@lru_cache(maxsize=8)
+def tier_arrays(tiers):
+    """Lower edges, widths and rates of a tier table as float arrays"""
+    thresholds = np.array([threshold for threshold, _ in tiers], dtype=float)
+    rates = np.array([rate for _, rate in tiers], dtype=float)
+    lower_edges = np.concatenate(([0.0], thresholds[:-1]))
+    return lower_edges, thresholds - lower_edges, rates
+
+
+def calculate_tiered_from_total(total_kwh, tiers, fixed_fee=0):
+    """Tiered tariff calculation from an already summed kWh total"""
+    lower_edges, widths, rates = tier_arrays(tuple(map(tuple, tiers)))  # hashable even for lists of lists
+
+    # kWh falling into each tier, then cost per tier
+    blocks = np.clip(total_kwh - lower_edges, 0, widths)
+    total_cost = float(blocks @ rates)
+    tier_breakdown = [(float(block), float(rate)) for block, rate in zip(blocks, rates) if block > 0]
 
     return total_cost + fixed_fee, tier_breakdown
 
 
 def compare_tariffs_from_data(df, flat_rate, tou_rates, tiered_tiers, fixed_fee=0):
     """Compare all tariffs and return results"""
-    flat_cost = calculate_flat_rate_from_data(df, flat_rate, fixed_fee)
+    total_kwh = float(total_kwh_of(df))  # shared by the flat and tiered calculations
+    flat_cost = calculate_flat_rate_from_total(total_kwh, flat_rate, fixed_fee)
     tou_cost, tou_breakdown = calculate_tou_from_data(df, tou_rates, fixed_fee)
-    tiered_cost, tiered_breakdown = calculate_tiered_from_data(df, tiered_tiers, fixed_fee)
+    tiered_cost, tiered_breakdown = calculate_tiered_from_total(total_kwh, tiered_tiers, fixed_fee)
 
     return {
         "Flat Rate": flat_cost,
@@ -98,20 +257,104 @@ def compare_tariffs_from_data(df, flat_rate, tou_rates, tiered_tiers, fixed_fee=
     }
 
 
+def summarize_consumption(df):
+    """Total kWh and per-period kWh sums, computed once per loaded file"""
+    period_sums = period_kwh_sums(*usage_arrays(df))
+    return period_sums.sum(), period_sums
+
+
+def compare_tariffs_from_summary(total_kwh, period_sums, flat_rate, tou_rates, tiered_tiers, fixed_fee=0):
+    """Compare all tariffs from precomputed consumption totals"""
+    flat_cost = calculate_flat_rate_from_total(total_kwh, flat_rate, fixed_fee)
+    tou_cost, tou_breakdown = calculate_tou_from_sums(period_sums, tou_rates, fixed_fee)
+    tiered_cost, tiered_breakdown = calculate_tiered_from_total(total_kwh, tiered_tiers, fixed_fee)
+
+    return {
+        "Flat Rate": flat_cost,
+        "Time-of-Use": tou_cost,
+        "Tiered": tiered_cost,
+        "TOU Breakdown": tou_breakdown,
+        "Tiered Breakdown": tiered_breakdown
+    }
+
+
+def stream_tariffs(file_path, flat_rate, tou_rates, tiered_tiers, fixed_fee=0, chunksize=1_000_000):
+    """Compare all tariffs by reading the CSV in chunks, without keeping it in memory"""
+    ts_col = find_timestamp_column(file_path)
+    total_kwh = 0.0
+    period_sums = np.zeros(len(_PERIODS))
+    dropped = False
+
+    for chunk in read_consumption_csv(file_path, ts_col, chunksize=chunksize):
+        timestamps = coerce_timestamps(chunk[ts_col])
+
+        kwh = chunk["kWh"].to_numpy(copy=False)
+        has_time = timestamps.notna().to_numpy()
+        dropped = dropped or not has_time.all()
+
+        # Skip invalid timestamps and missing kWh readings
+        valid = has_time & ~np.isnan(kwh)
+        if not valid.all():
+            timestamps, kwh = timestamps[valid], kwh[valid]
+
+        chunk_sums = period_kwh_sums(timestamps.dt.hour.to_numpy(np.int8), kwh)
+        period_sums += chunk_sums
+        total_kwh += chunk_sums.sum()
+
+    if dropped:
+        print("Warning: Some rows had invalid timestamps and were dropped.")
+
+    return compare_tariffs_from_summary(total_kwh, period_sums, flat_rate, tou_rates, tiered_tiers, fixed_fee)
+
+
 # GUI and Visualization
 
+# Example TOU and Tiered tariffs
+TOU_RATES = {"Peak": 0.40, "Shoulder": 0.25, "Off-Peak": 0.15}
+TIERED_TIERS = ((100, 0.20), (300, 0.30), (np.inf, 0.40))
+
 consumption_df = None
+consumption_summary = None  # (total kWh, per-period kWh sums) of consumption_df
+consumption_key = None  # (file path, mtime) consumption_df was loaded from
+
+# Results of previous calculations, keyed by file and tariff parameters
+_result_cache = {}
+RESULT_CACHE_SIZE = 32
+
+# Single worker so loading and calculating don't block the Tk event loop
+_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def set_busy(busy):
+    """Disable the buttons while a job runs on the worker thread"""
+    state = tk.DISABLED if busy else tk.NORMAL
+    btn_load.config(state=state)
+    btn_calculate.config(state=state)
 
 
 def load_file():
-    global consumption_df
     file_path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
     if file_path:
-        try:
-            consumption_df = load_consumption_data(file_path)
-            messagebox.showinfo("File Loaded", f"Data loaded from {file_path}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load file: {e}")
+        # Parse on the worker thread, then store the data back on the Tk thread
+        set_busy(True)
+        future = _executor.submit(load_job, file_path)
+        future.add_done_callback(lambda f: root.after(0, finish_load, f, file_path))
+
+
+def load_job(file_path):
+    """Parse and summarize a consumption file (runs on the worker thread)"""
+    df = load_consumption_data(file_path)
+    return df, summarize_consumption(df), (file_path, os.path.getmtime(file_path))
+
+
+def finish_load(future, file_path):
+    global consumption_df, consumption_summary, consumption_key
+    set_busy(False)
+    try:
+        consumption_df, consumption_summary, consumption_key = future.result()
+        messagebox.showinfo("File Loaded", f"Data loaded from {file_path}")
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to load file: {e}")
 
 
 def calculate_bill():
@@ -123,64 +366,113 @@ def calculate_bill():
     try:
         flat_rate = float(entry_flat_rate.get())
         fixed_fee = float(entry_fixed_fee.get())
+    except ValueError:
+        messagebox.showerror("Input Error", "Please enter valid numbers.")
+        return
 
-        # Example TOU and Tiered tariffs
-        tou_rates = {"Peak": 0.40, "Shoulder": 0.25, "Off-Peak": 0.15}
-        tiered_tiers = [(100, 0.20), (300, 0.30), (float('inf'), 0.40)]
+    # Calculate on the worker thread, then show results back on the Tk thread
+    set_busy(True)
+    future = _executor.submit(calculate_job, consumption_df, consumption_key, consumption_summary, flat_rate, fixed_fee)
+    future.add_done_callback(lambda f: root.after(0, show_results, f))
 
-        results = compare_tariffs_from_data(consumption_df, flat_rate, tou_rates, tiered_tiers, fixed_fee)
 
-        # Output results
-        msg = "\n".join([f"{k}: ${v:.2f}" for k, v in results.items() if k != "TOU Breakdown" and k != "Tiered Breakdown"])
-        msg += "\n\n--- TOU Breakdown ---\n"
-        for period, data in results["TOU Breakdown"].items():
-            msg += f"{period}: {data['kWh']:.1f} kWh × ${data['rate']:.2f} = ${data['cost']:.2f}\n"
+def calculate_job(df, file_key, summary, flat_rate, fixed_fee):
+    """Bill results plus downsampled usage for the charts (runs on the worker thread)"""
+    return cached_results(file_key, summary, flat_rate, fixed_fee), usage_plot_data(df)
 
-        msg += "\n--- Tiered Breakdown ---\n"
-        for block, rate in results["Tiered Breakdown"]:
-            msg += f"Consumption: {block} kWh × ${rate:.2f} = ${block * rate:.2f}\n"
 
-        messagebox.showinfo("Bill Comparison", msg)
+def cached_results(file_key, summary, flat_rate, fixed_fee):
+    """Tariff comparison for the loaded file, reusing earlier results for the same inputs"""
+    key = (file_key, flat_rate, fixed_fee, tuple(TOU_RATES.items()), TIERED_TIERS)
+    results = _result_cache.get(key)
+    if results is None:
+        total_kwh, period_sums = summary
+        results = compare_tariffs_from_summary(total_kwh, period_sums, flat_rate, TOU_RATES, TIERED_TIERS, fixed_fee)
+        if len(_result_cache) >= RESULT_CACHE_SIZE:
+            _result_cache.pop(next(iter(_result_cache)))
+        _result_cache[key] = results
+    return results
 
-        # Visualize Charts
-        plot_charts(consumption_df, results)
 
-    except ValueError:
-        messagebox.showerror("Input Error", "Please enter valid numbers.")
+def show_results(future):
+    """Show the bill comparison and charts once the worker has finished"""
+    set_busy(False)
+    try:
+        results, usage = future.result()
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to calculate bills: {e}")
+        return
 
+    # Output results
+    msg = "\n".join([f"{k}: ${v:.2f}" for k, v in results.items() if k != "TOU Breakdown" and k != "Tiered Breakdown"])
+    msg += "\n\n--- TOU Breakdown ---\n"
+    for period, data in results["TOU Breakdown"].items():
+        msg += f"{period}: {data['kWh']:.1f} kWh × ${data['rate']:.2f} = ${data['cost']:.2f}\n"
 
-def plot_charts(df, results):
-    """Show line chart (usage trend) + bar chart (bill comparison)"""
-    fig, axes = plt.subplots(2, 1, figsize=(6, 6))
+    msg += "\n--- Tiered Breakdown ---\n"
+    for block, rate in results["Tiered Breakdown"]:
+        msg += f"Consumption: {block} kWh × ${rate:.2f} = ${block * rate:.2f}\n"
 
-    # Line Chart for Electricity usage trend
-    df_sorted = df.sort_values('timestamp')
-    axes[0].plot(df_sorted['timestamp'], df_sorted['kWh'], color="blue", linewidth=1.5)
-    axes[0].set_title("Electricity Usage Trend")
-    axes[0].set_xlabel("Time")
-    axes[0].set_ylabel("kWh")
+    messagebox.showinfo("Bill Comparison", msg)
+
+    # Visualize Charts
+    plot_charts(usage, results)
+
+
+PLOT_POINTS = 2000
 
-    # Bar Chart for Bill Comparison
-    labels = [k for k in results.keys() if k != "TOU Breakdown" and k != "Tiered Breakdown"]
-    costs = [v for k, v in results.items() if k != "TOU Breakdown" and k != "Tiered Breakdown"]
 
-    axes[1].bar(labels, costs, color=["orange", "green", "purple"])
-    axes[1].set_title("Bill Comparison")
-    axes[1].set_ylabel("Cost ($)")
+def downsample_usage(timestamps, kwh, target_points=PLOT_POINTS):
+    """Bucket sorted usage into at most target_points windows of mean/min/max kWh"""
+    step = -(-len(kwh) // target_points)  # ceiling division
+    if step <= 1:
+        return timestamps, kwh, kwh, kwh
 
-    plt.tight_layout()
+    starts = np.arange(0, len(kwh), step)
+    counts = np.diff(np.append(starts, len(kwh)))
+    mean_kwh = np.add.reduceat(kwh, starts, dtype=np.float64) / counts
+    return timestamps[starts], mean_kwh, np.minimum.reduceat(kwh, starts), np.maximum.reduceat(kwh, starts)
 
-    # Embed plots in Tkinter window
-    canvas = FigureCanvasTkAgg(fig, master=root)
-    canvas.draw()
+
+def usage_plot_data(df):
+    """Usage line for plot_charts: date numbers, mean/min/max kWh and whether rows were bucketed"""
+    # df is sorted by timestamp when loaded; plot at most ~PLOT_POINTS buckets
+    times, mean_kwh, min_kwh, max_kwh = downsample_usage(df['timestamp'].values, df['kWh'].values)
+    return mdates.date2num(times), mean_kwh, min_kwh, max_kwh, len(times) < len(df)
+
+
+def plot_charts(usage, results):
+    """Update line chart (usage trend) + bar chart (bill comparison) in place"""
+    global usage_envelope
+
+    # Line Chart for Electricity usage trend
+    times, mean_kwh, min_kwh, max_kwh, downsampled = usage
+    usage_line.set_data(times, mean_kwh)
+    if usage_envelope is not None:
+        usage_envelope.remove()
+        usage_envelope = None
+    if downsampled:
+        usage_envelope = ax_usage.fill_between(times, min_kwh, max_kwh, color="blue", alpha=0.2, linewidth=0)
+    ax_usage.relim()
+    ax_usage.autoscale_view()
+
+    # Bar Chart for Bill Comparison
+    for bar, label in zip(bill_bars, BILL_LABELS):
+        bar.set_height(results[label])
+    ax_bills.relim()
+    ax_bills.autoscale_view()
+
+    # Embed plots in Tkinter window on first use, then just redraw
     canvas.get_tk_widget().grid(row=5, columnspan=2, pady=10)
+    canvas.draw_idle()
 
 
 # Tkinter UI setup
 root = tk.Tk()
 root.title("XPower Household Tariff Analysis")
 
-tk.Button(root, text="Load Consumption File", command=load_file).grid(row=0, columnspan=2, pady=5)
+btn_load = tk.Button(root, text="Load Consumption File", command=load_file)
+btn_load.grid(row=0, columnspan=2, pady=5)
 
 tk.Label(root, text="Flat Rate ($/kWh):").grid(row=1, column=0)
 entry_flat_rate = tk.Entry(root)
@@ -192,7 +484,25 @@ entry_fixed_fee = tk.Entry(root)
 entry_fixed_fee.insert(0, "10")
 entry_fixed_fee.grid(row=2, column=1)
 
-tk.Button(root, text="Calculate Bills", command=calculate_bill).grid(row=3, columnspan=2, pady=10)
+btn_calculate = tk.Button(root, text="Calculate Bills", command=calculate_bill)
+btn_calculate.grid(row=3, columnspan=2, pady=10)
 
-root.mainloop()
+# Charts are created once and updated by plot_charts
+BILL_LABELS = ["Flat Rate", "Time-of-Use", "Tiered"]
+fig, (ax_usage, ax_bills) = plt.subplots(2, 1, figsize=(6, 6))
+
+usage_line, = ax_usage.plot([], [], color="blue", linewidth=1.5)
+usage_envelope = None
+ax_usage.xaxis_date()
+ax_usage.set_title("Electricity Usage Trend")
+ax_usage.set_xlabel("Time")
+ax_usage.set_ylabel("kWh")
 
+bill_bars = ax_bills.bar(BILL_LABELS, [0, 0, 0], color=["orange", "green", "purple"])
+ax_bills.set_title("Bill Comparison")
+ax_bills.set_ylabel("Cost ($)")
+
+fig.tight_layout()
+canvas = FigureCanvasTkAgg(fig, master=root)
+
+root.mainloop()